@@ -14,15 +14,16 @@ import sys
 import time
 import re
 from pathlib import Path
+from typing import Optional
 
-from patchright.sync_api import sync_playwright
+from patchright.sync_api import sync_playwright, Page
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from auth_manager import AuthManager
 from notebook_manager import NotebookLibrary
-from config import QUERY_INPUT_SELECTORS, RESPONSE_SELECTORS
+from config import QUERY_INPUT_SELECTORS, RESPONSE_SELECTORS, QUERY_TIMEOUT_SECONDS
 from browser_utils import BrowserFactory, StealthUtils
 
 
@@ -37,6 +38,117 @@ FOLLOW_UP_REMINDER = (
 )
 
 
+def submit_question(page: Page, notebook_url: str, question: str) -> bool:
+    """
+    Open a notebook in the given page and submit a question without waiting
+    for the answer, so several tabs can generate answers at the same time.
+
+    Returns:
+        True if the question was submitted
+    """
+    # Navigate to notebook
+    print("  🌐 Opening notebook...")
+    page.goto(notebook_url, wait_until="domcontentloaded")
+
+    # Wait for NotebookLM
+    page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=10000)
+
+    # Wait for query input (MCP approach)
+    print("  ⏳ Waiting for query input...")
+    query_element = None
+
+    for selector in QUERY_INPUT_SELECTORS:
+        try:
+            query_element = page.wait_for_selector(
+                selector,
+                timeout=10000,
+                state="visible"  # Only check visibility, not disabled!
+            )
+            if query_element:
+                print(f"  ✓ Found input: {selector}")
+                break
+        except:
+            continue
+
+    if not query_element:
+        print("  ❌ Could not find query input")
+        return False
+
+    # Type question (human-like, fast)
+    print("  ⏳ Typing question...")
+
+    # Use primary selector for typing
+    input_selector = QUERY_INPUT_SELECTORS[0]
+    StealthUtils.human_type(page, input_selector, question)
+
+    # Submit
+    print("  📤 Submitting...")
+    page.keyboard.press("Enter")
+
+    # Small pause
+    StealthUtils.random_delay(500, 1500)
+    return True
+
+
+def wait_for_answer(page: Page, timeout_seconds: int = QUERY_TIMEOUT_SECONDS) -> Optional[str]:
+    """
+    Wait for the newest NotebookLM response in the page to stop changing.
+
+    Returns:
+        Answer text, or None on timeout
+    """
+    # Wait for response (MCP approach: poll for stable text)
+    print("  ⏳ Waiting for answer...")
+
+    answer = None
+    stable_count = 0
+    last_text = None
+    deadline = time.time() + timeout_seconds
+
+    while time.time() < deadline:
+        # Check if NotebookLM is still thinking (most reliable indicator)
+        try:
+            thinking_element = page.query_selector('div.thinking-message')
+            if thinking_element and thinking_element.is_visible():
+                time.sleep(1)
+                continue
+        except:
+            pass
+
+        # Try to find response with MCP selectors
+        for selector in RESPONSE_SELECTORS:
+            try:
+                elements = page.query_selector_all(selector)
+                if elements:
+                    # Get last (newest) response
+                    latest = elements[-1]
+                    text = latest.inner_text().strip()
+
+                    if text:
+                        if text == last_text:
+                            stable_count += 1
+                            if stable_count >= 3:  # Stable for 3 polls
+                                answer = text
+                                break
+                        else:
+                            stable_count = 0
+                            last_text = text
+            except:
+                continue
+
+        if answer:
+            break
+
+        time.sleep(1)
+
+    if not answer:
+        print("  ❌ Timeout waiting for answer")
+        return None
+
+    print("  ✅ Got answer!")
+    return answer
+
+
 def ask_notebooklm(question: str, notebook_url: str, headless: bool = True) -> str:
     """
     Ask a question to NotebookLM
@@ -60,6 +172,7 @@ def ask_notebooklm(question: str, notebook_url: str, headless: bool = True) -> s
 
     playwright = None
     context = None
+    page = None
 
     try:
         # Start playwright
@@ -71,98 +184,14 @@ def ask_notebooklm(question: str, notebook_url: str, headless: bool = True) -> s
             headless=headless
         )
 
-        # Navigate to notebook
         page = context.new_page()
-        print("  🌐 Opening notebook...")
-        page.goto(notebook_url, wait_until="domcontentloaded")
-
-        # Wait for NotebookLM
-        page.wait_for_url(re.compile(r"^https://notebooklm\.google\.com/"), timeout=10000)
-
-        # Wait for query input (MCP approach)
-        print("  ⏳ Waiting for query input...")
-        query_element = None
-
-        for selector in QUERY_INPUT_SELECTORS:
-            try:
-                query_element = page.wait_for_selector(
-                    selector,
-                    timeout=10000,
-                    state="visible"  # Only check visibility, not disabled!
-                )
-                if query_element:
-                    print(f"  ✓ Found input: {selector}")
-                    break
-            except:
-                continue
-
-        if not query_element:
-            print("  ❌ Could not find query input")
+        if not submit_question(page, notebook_url, question):
             return None
 
-        # Type question (human-like, fast)
-        print("  ⏳ Typing question...")
-        
-        # Use primary selector for typing
-        input_selector = QUERY_INPUT_SELECTORS[0]
-        StealthUtils.human_type(page, input_selector, question)
-
-        # Submit
-        print("  📤 Submitting...")
-        page.keyboard.press("Enter")
-
-        # Small pause
-        StealthUtils.random_delay(500, 1500)
-
-        # Wait for response (MCP approach: poll for stable text)
-        print("  ⏳ Waiting for answer...")
-
-        answer = None
-        stable_count = 0
-        last_text = None
-        deadline = time.time() + 120  # 2 minutes timeout
-
-        while time.time() < deadline:
-            # Check if NotebookLM is still thinking (most reliable indicator)
-            try:
-                thinking_element = page.query_selector('div.thinking-message')
-                if thinking_element and thinking_element.is_visible():
-                    time.sleep(1)
-                    continue
-            except:
-                pass
-
-            # Try to find response with MCP selectors
-            for selector in RESPONSE_SELECTORS:
-                try:
-                    elements = page.query_selector_all(selector)
-                    if elements:
-                        # Get last (newest) response
-                        latest = elements[-1]
-                        text = latest.inner_text().strip()
-
-                        if text:
-                            if text == last_text:
-                                stable_count += 1
-                                if stable_count >= 3:  # Stable for 3 polls
-                                    answer = text
-                                    break
-                            else:
-                                stable_count = 0
-                                last_text = text
-                except:
-                    continue
-
-            if answer:
-                break
-
-            time.sleep(1)
-
+        answer = wait_for_answer(page)
         if not answer:
-            print("  ❌ Timeout waiting for answer")
             return None
 
-        print("  ✅ Got answer!")
         # Add follow-up reminder to encourage Claude to ask more questions
         return answer + FOLLOW_UP_REMINDER
 
@@ -173,10 +202,17 @@ def ask_notebooklm(question: str, notebook_url: str, headless: bool = True) -> s
         return None
 
     finally:
-        # Always clean up
+        # Always clean up; close our tab explicitly since a daemon
+        # context stays open after release
+        if page:
+            try:
+                page.close()
+            except:
+                pass
+
         if context:
             try:
-                context.close()
+                BrowserFactory.close_context(context)
             except:
                 pass
 
@@ -97,8 +97,13 @@ class AuthManager:
         print("🔐 Starting authentication setup...")
         print(f"  Timeout: {timeout_minutes} minutes")
 
+        # A visible login window can't be opened in the daemon's Chrome
+        if not headless and self._daemon_running():
+            return False
+
         playwright = None
         context = None
+        page = None
 
         try:
             playwright = sync_playwright().start()
@@ -145,9 +150,16 @@ class AuthManager:
 
         finally:
             # Clean up browser resources
+            # Close our tab explicitly; a daemon context stays open after release
+            if page:
+                try:
+                    page.close()
+                except Exception:
+                    pass
+
             if context:
                 try:
-                    context.close()
+                    BrowserFactory.close_context(context)
                 except Exception:
                     pass
 
@@ -179,6 +191,14 @@ class AuthManager:
         except Exception:
             pass  # Non-critical
 
+    def _daemon_running(self) -> bool:
+        """Warn and return True if browser_daemon.py holds the browser profile"""
+        if BrowserFactory.daemon_endpoint():
+            print("  ⚠️ The browser daemon is running and holds the browser profile")
+            print("  Stop it first: python scripts/run.py browser_daemon.py stop")
+            return True
+        return False
+
     def clear_auth(self) -> bool:
         """
         Clear all authentication data
@@ -188,6 +208,10 @@ class AuthManager:
         """
         print("🗑️ Clearing authentication data...")
 
+        # Chrome is still using the profile that would be deleted
+        if self._daemon_running():
+            return False
+
         try:
             # Remove browser state
             if self.state_file.exists():
@@ -224,6 +248,9 @@ class AuthManager:
         """
         print("🔄 Starting re-authentication...")
 
+        if self._daemon_running():
+            return False
+
         # Clear existing auth
         self.clear_auth()
 
@@ -245,6 +272,7 @@ class AuthManager:
 
         playwright = None
         context = None
+        page = None
 
         try:
             playwright = sync_playwright().start()
@@ -272,9 +300,16 @@ class AuthManager:
             return False
 
         finally:
+            # Close our tab explicitly; a daemon context stays open after release
+            if page:
+                try:
+                    page.close()
+                except Exception:
+                    pass
+
             if context:
                 try:
-                    context.close()
+                    BrowserFactory.close_context(context)
                 except Exception:
                     pass
             if playwright:
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Browser Daemon for NotebookLM
+Keeps one Chrome running on the skill's browser profile so every script
+(ask_question.py, discover_notebooks.py, get_titles.py, auth validation)
+shares it over CDP instead of each launching its own
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import BROWSER_PROFILE_DIR, CDP_ENDPOINT_FILE
+from browser_utils import BrowserFactory
+
+# Chrome writes "<port>\n<browser ws path>" here when started with
+# --remote-debugging-port=0, which picks a free port
+DEVTOOLS_PORT_FILE = BROWSER_PROFILE_DIR / "DevToolsActivePort"
+
+
+def read_ws_endpoint(timeout_seconds: float = 10) -> Optional[str]:
+    """
+    Build the browser WebSocket endpoint from DevToolsActivePort
+
+    Args:
+        timeout_seconds: Keep retrying this long while Chrome starts up
+
+    Returns:
+        WebSocket URL, or None if Chrome never wrote the file
+    """
+    deadline = time.time() + timeout_seconds
+    while True:
+        try:
+            port, path = DEVTOOLS_PORT_FILE.read_text().split("\n")[:2]
+            return f"ws://127.0.0.1:{int(port)}{path.strip()}"
+        except (OSError, ValueError):
+            if time.time() >= deadline:
+                return None
+            time.sleep(0.5)
+
+
+def start_daemon(headless: bool = True) -> bool:
+    """Launch Chrome with remote debugging and block until it exits"""
+    from patchright.sync_api import sync_playwright
+
+    endpoint = BrowserFactory.daemon_endpoint()
+    if endpoint:
+        print(f"✅ Browser daemon already running at {endpoint}")
+        return True
+
+    # Don't pick up the port of an earlier Chrome
+    DEVTOOLS_PORT_FILE.unlink(missing_ok=True)
+
+    print("🚀 Starting browser daemon...")
+    with sync_playwright() as playwright:
+        context = BrowserFactory.launch_persistent_context(
+            playwright,
+            headless=headless,
+            extra_args=["--remote-debugging-port=0"],
+            use_daemon=False
+        )
+        try:
+            endpoint = read_ws_endpoint()
+            if not endpoint:
+                print("❌ Chrome did not expose a CDP endpoint")
+                return False
+
+            CDP_ENDPOINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CDP_ENDPOINT_FILE.write_text(endpoint)
+            print(f"  ✅ Listening at {endpoint}")
+            print("  Scripts will now reuse this browser. Press Ctrl+C to stop.")
+
+            # Block until Chrome is closed (or `stop` is run)
+            context.wait_for_event("close", timeout=0)
+        except KeyboardInterrupt:
+            print("\n🛑 Stopping browser daemon...")
+        finally:
+            CDP_ENDPOINT_FILE.unlink(missing_ok=True)
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    return True
+
+
+def stop_daemon() -> bool:
+    """Ask the daemon's Chrome to shut down over CDP"""
+    from patchright.sync_api import sync_playwright
+
+    endpoint = BrowserFactory.daemon_endpoint()
+    if not endpoint:
+        print("ℹ️  Browser daemon is not running")
+        CDP_ENDPOINT_FILE.unlink(missing_ok=True)
+        return True
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.connect_over_cdp(endpoint)
+        try:
+            browser.new_browser_cdp_session().send("Browser.close")
+        except Exception:
+            # Chrome may drop the connection before replying
+            pass
+
+    CDP_ENDPOINT_FILE.unlink(missing_ok=True)
+    print("✅ Browser daemon stopped")
+    return True
+
+
+def main():
+    """Command-line interface for the browser daemon"""
+    parser = argparse.ArgumentParser(description='Run a shared Chrome for NotebookLM scripts')
+
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+
+    # Start command
+    start_parser = subparsers.add_parser('start', help='Start the daemon (runs until Ctrl+C)')
+    start_parser.add_argument('--show-browser', action='store_true', help='Show browser')
+
+    # Stop command
+    subparsers.add_parser('stop', help='Stop a running daemon')
+
+    # Status command
+    subparsers.add_parser('status', help='Check whether the daemon is running')
+
+    args = parser.parse_args()
+
+    if args.command == 'start':
+        if not start_daemon(headless=not args.show_browser):
+            sys.exit(1)
+
+    elif args.command == 'stop':
+        stop_daemon()
+
+    elif args.command == 'status':
+        endpoint = BrowserFactory.daemon_endpoint()
+        print("\n🔗 Browser Daemon Status:")
+        print(f"  Running: {'Yes' if endpoint else 'No'}")
+        if endpoint:
+            print(f"  Endpoint: {endpoint}")
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,33 +7,61 @@ import json
 import os
 import time
 import random
+import urllib.request
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional, List, Set
+from urllib.parse import urlparse
 
-from patchright.sync_api import Playwright, BrowserContext, Page
-from config import BROWSER_PROFILE_DIR, STATE_FILE, BROWSER_ARGS, USER_AGENT
+from patchright.sync_api import Playwright, BrowserContext, ElementHandle, Page
+from config import BROWSER_PROFILE_DIR, STATE_FILE, CDP_ENDPOINT_FILE, BROWSER_ARGS, USER_AGENT
 
 
 class BrowserFactory:
     """Factory for creating configured browser contexts"""
 
+    # Parsed state.json cookies, reused while the file's mtime is unchanged
+    _cookies_cache: Optional[List[dict]] = None
+    _cookies_mtime: float = 0
+
+    # Profile dirs whose SingletonLock has already been checked this process
+    _lock_checked: Set[str] = set()
+
+    # Contexts borrowed from browser_daemon.py over CDP
+    _daemon_contexts = weakref.WeakSet()
+
     @staticmethod
     def launch_persistent_context(
         playwright: Playwright,
         headless: bool = True,
-        user_data_dir: str = str(BROWSER_PROFILE_DIR)
+        user_data_dir: str = str(BROWSER_PROFILE_DIR),
+        extra_args: Optional[List[str]] = None,
+        use_daemon: bool = True
     ) -> BrowserContext:
         """
         Launch a persistent browser context with anti-detection features
         and cookie workaround.
+
+        If browser_daemon.py is running on the default profile, its context is
+        returned over CDP instead, since Chrome locks the profile to the
+        daemon. Release either kind with BrowserFactory.close_context().
         """
-        # Auto-clean stale SingletonLock before launching
-        BrowserFactory._clean_stale_lock(user_data_dir)
+        if use_daemon and user_data_dir == str(BROWSER_PROFILE_DIR):
+            context = BrowserFactory.connect_if_daemon_running(playwright)
+            if context:
+                return context
+
+        # Auto-clean stale SingletonLock before the first launch per profile;
+        # after that any lock is held by this process
+        if user_data_dir not in BrowserFactory._lock_checked:
+            BrowserFactory._clean_stale_lock(user_data_dir)
+            BrowserFactory._lock_checked.add(user_data_dir)
 
         # When headless, add explicit Chrome flags so Chrome is truly invisible
         # on macOS (no Dock icon, no window). Auth setup intentionally passes
         # headless=False so the user can interact with the Google login page.
-        extra_args = ['--headless=new', '--disable-gpu'] if headless else []
+        headless_args = ['--headless=new', '--disable-gpu'] if headless else []
 
         # Launch persistent context
         context = playwright.chromium.launch_persistent_context(
@@ -43,7 +71,7 @@ class BrowserFactory:
             no_viewport=True,
             ignore_default_args=["--enable-automation"],
             user_agent=USER_AGENT,
-            args=BROWSER_ARGS + extra_args
+            args=BROWSER_ARGS + headless_args + (extra_args or [])
         )
 
         # Cookie Workaround for Playwright bug #36139
@@ -52,6 +80,59 @@ class BrowserFactory:
 
         return context
 
+    @staticmethod
+    def daemon_endpoint() -> Optional[str]:
+        """WebSocket endpoint of the running browser daemon, or None"""
+        if not CDP_ENDPOINT_FILE.exists():
+            return None
+        try:
+            endpoint = CDP_ENDPOINT_FILE.read_text().strip()
+            # A crashed daemon leaves the file behind; make sure Chrome answers
+            port = urlparse(endpoint).port
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=2):
+                pass
+            return endpoint
+        except Exception:
+            return None
+
+    @staticmethod
+    def connect_if_daemon_running(playwright: Playwright) -> Optional[BrowserContext]:
+        """
+        Connect to the Chrome started by browser_daemon.py, if it is running.
+
+        Returns the daemon's persistent context, or None so the caller can
+        launch its own.
+        """
+        endpoint = BrowserFactory.daemon_endpoint()
+        if not endpoint:
+            return None
+        try:
+            browser = playwright.chromium.connect_over_cdp(endpoint, timeout=5000)
+        except Exception:
+            print("  ⚠️  Browser daemon not reachable, launching Chrome instead")
+            return None
+        if not browser.contexts:
+            browser.close()
+            return None
+        print("  🔗 Connected to browser daemon")
+        context = browser.contexts[0]
+        BrowserFactory._daemon_contexts.add(context)
+        return context
+
+    @staticmethod
+    def is_daemon_context(context: BrowserContext) -> bool:
+        """True if context belongs to the browser daemon's Chrome"""
+        return context in BrowserFactory._daemon_contexts
+
+    @staticmethod
+    def close_context(context: BrowserContext):
+        """Close a launched context, or just disconnect from the daemon's Chrome"""
+        if BrowserFactory.is_daemon_context(context):
+            # Disconnect only; the daemon keeps its Chrome running
+            context.browser.close()
+        else:
+            context.close()
+
     @staticmethod
     def _clean_stale_lock(user_data_dir: str):
         """Remove SingletonLock if the owning process is dead."""
@@ -73,23 +154,140 @@ class BrowserFactory:
             except OSError:
                 pass
 
-    @staticmethod
-    def _inject_cookies(context: BrowserContext):
+    @classmethod
+    def _inject_cookies(cls, context: BrowserContext):
         """Inject cookies from state.json if available"""
         if STATE_FILE.exists():
             try:
-                with open(STATE_FILE, 'r') as f:
-                    state = json.load(f)
-                    if 'cookies' in state and len(state['cookies']) > 0:
-                        context.add_cookies(state['cookies'])
-                        # print(f"  🔧 Injected {len(state['cookies'])} cookies from state.json")
+                # Only re-parse state.json when it has changed since the last launch
+                mtime = STATE_FILE.stat().st_mtime
+                if cls._cookies_cache is None or mtime != cls._cookies_mtime:
+                    with open(STATE_FILE, 'r') as f:
+                        state = json.load(f)
+                    cls._cookies_cache = state.get('cookies', [])
+                    cls._cookies_mtime = mtime
+                if len(cls._cookies_cache) > 0:
+                    context.add_cookies(cls._cookies_cache)
+                    # print(f"  🔧 Injected {len(cls._cookies_cache)} cookies from state.json")
             except Exception as e:
                 print(f"  ⚠️  Could not load state.json: {e}")
 
 
+class BrowserPool:
+    """
+    Pre-launched persistent context shared across a script's whole run.
+
+    Callers check the context out, open tabs in it and hand it back, so no
+    notebook visit pays a Chrome cold start. The context is relaunched after
+    MAX_USES checkouts to keep Chrome's memory from drifting.
+
+    Chrome locks a profile to one process and sync Playwright is
+    single-threaded, so the pool holds one context; concurrency comes from
+    tabs within it.
+    """
+
+    MAX_USES = 50
+
+    def __init__(self, playwright: Playwright, headless: bool = True):
+        """
+        Args:
+            playwright: Running Playwright instance
+            headless: Run browser in headless mode
+        """
+        self.playwright = playwright
+        self.headless = headless
+        self._context: Optional[BrowserContext] = None
+        self._uses = 0
+        self._checked_out = False
+        self._launch()
+
+    def _launch(self):
+        # Reuses the browser daemon's Chrome when one is running
+        self._context = BrowserFactory.launch_persistent_context(
+            self.playwright,
+            headless=self.headless
+        )
+
+    def _release(self):
+        context, self._context = self._context, None
+        if not context:
+            return
+        try:
+            BrowserFactory.close_context(context)
+        except Exception:
+            pass
+
+    @contextmanager
+    def checkout(self) -> Iterator[BrowserContext]:
+        """Borrow the context for the duration of the with-block"""
+        if self._context is None:
+            raise RuntimeError("BrowserPool is closed")
+        if self._checked_out:
+            # Waiting would deadlock: the holder runs on this same thread
+            raise RuntimeError("BrowserPool context is already checked out")
+
+        # The daemon's Chrome is long-lived by design, so it isn't recycled
+        if self._uses >= self.MAX_USES and not BrowserFactory.is_daemon_context(self._context):
+            self._release()
+            self._launch()
+            self._uses = 0
+
+        self._checked_out = True
+        self._uses += 1
+        try:
+            yield self._context
+        finally:
+            self._checked_out = False
+
+    def close(self):
+        """Close the pool's context; later checkouts raise"""
+        self._release()
+
+
 class StealthUtils:
     """Human-like interaction utilities"""
 
+    # Per-page {selector: ElementHandle}, cleared when the page navigates
+    _handle_cache = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _page_cache(page: Page) -> dict:
+        """Selector -> ElementHandle cache for page, created on first use"""
+        cache = StealthUtils._handle_cache.get(page)
+        if cache is None:
+            cache = StealthUtils._handle_cache[page] = {}
+            # Handles die with the document; don't capture page in the listener
+            page.on("framenavigated", lambda frame: cache.clear() if frame.parent_frame is None else None)
+        return cache
+
+    @staticmethod
+    def _query_selector(page: Page, selector: str) -> Optional[ElementHandle]:
+        """page.query_selector, reusing a handle found earlier on the same page"""
+        cache = StealthUtils._page_cache(page)
+        element = cache.get(selector)
+        if element is None:
+            element = page.query_selector(selector)
+            if element:
+                cache[selector] = element
+        return element
+
+    @staticmethod
+    def _forget(page: Page, selector: str):
+        """Drop a cached handle, e.g. after the element was re-rendered"""
+        StealthUtils._handle_cache.get(page, {}).pop(selector, None)
+
+    @staticmethod
+    def _click(page: Page, selector: str, element: ElementHandle):
+        """Click element, re-querying once if a cached handle went stale"""
+        try:
+            element.click()
+        except Exception:
+            StealthUtils._forget(page, selector)
+            element = StealthUtils._query_selector(page, selector)
+            if not element:
+                raise
+            element.click()
+
     @staticmethod
     def random_delay(min_ms: int = 100, max_ms: int = 500):
         """Add random delay"""
@@ -98,11 +296,13 @@ class StealthUtils:
     @staticmethod
     def human_type(page: Page, selector: str, text: str, wpm_min: int = 320, wpm_max: int = 480):
         """Type with human-like speed"""
-        element = page.query_selector(selector)
+        element = StealthUtils._query_selector(page, selector)
         if not element:
             # Try waiting if not immediately found
             try:
                 element = page.wait_for_selector(selector, timeout=2000)
+                if element:
+                    StealthUtils._page_cache(page)[selector] = element
             except:
                 pass
         
@@ -111,18 +311,23 @@ class StealthUtils:
             return
 
         # Click to focus
-        element.click()
+        StealthUtils._click(page, selector, element)
         
-        # Type
-        for char in text:
-            element.type(char, delay=random.uniform(25, 75))
-            if random.random() < 0.05:
+        # Type in runs of 8-20 characters: one keyboard.type call per run
+        # instead of one protocol round-trip per character
+        pos = 0
+        while pos < len(text):
+            chunk = text[pos:pos + random.randint(8, 20)]
+            pos += len(chunk)
+            page.keyboard.type(chunk, delay=random.randint(25, 75))
+            # Occasional thinking pause, same rate as ~5% of characters
+            if pos < len(text) and random.random() < 1 - 0.95 ** len(chunk):
                 time.sleep(random.uniform(0.15, 0.4))
 
     @staticmethod
     def realistic_click(page: Page, selector: str):
         """Click with realistic movement"""
-        element = page.query_selector(selector)
+        element = StealthUtils._query_selector(page, selector)
         if not element:
             return
 
@@ -134,5 +339,5 @@ class StealthUtils:
             page.mouse.move(x, y, steps=5)
 
         StealthUtils.random_delay(100, 300)
-        element.click()
+        StealthUtils._click(page, selector, element)
         StealthUtils.random_delay(100, 300)
@@ -11,6 +11,7 @@ DATA_DIR = SKILL_DIR / "data"
 BROWSER_STATE_DIR = DATA_DIR / "browser_state"
 BROWSER_PROFILE_DIR = BROWSER_STATE_DIR / "browser_profile"
 STATE_FILE = BROWSER_STATE_DIR / "state.json"
+CDP_ENDPOINT_FILE = BROWSER_STATE_DIR / "cdp_endpoint"
 AUTH_INFO_FILE = DATA_DIR / "auth_info.json"
 LIBRARY_FILE = DATA_DIR / "library.json"
 
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """Discover all notebooks from the NotebookLM home page."""
 import json
+import os
 import re
 import sys
-import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from browser_utils import BrowserFactory
+
+try:
+    import orjson
+except ImportError:  # .venv created before orjson was added to requirements.txt
+    orjson = None
 
 _SWITCH_TO_LIST_VIEW_JS = """() => {
     const icons = document.querySelectorAll('mat-icon');
@@ -22,12 +27,24 @@ _SWITCH_TO_LIST_VIEW_JS = """() => {
 }"""
 
 
+# Home page is usable once it shows table rows or the list-view toggle
+_HOME_READY_JS = """() => {
+    if (document.querySelector('project-table tr td, table tr td')) return true;
+    const icons = document.querySelectorAll('mat-icon');
+    return Array.from(icons).some(icon => icon.textContent.trim() === 'view_headline');
+}"""
+
+_ROWS_RENDERED_JS = """(expected) => {
+    const cells = document.querySelectorAll('project-table tr td:first-child, table tr td:first-child');
+    return Array.from(cells).filter(c => c.textContent.trim().length > 0).length >= expected;
+}"""
+
+
 def _switch_to_list_view(page):
     """Click the list-view toggle if the page is in grid/card view. Returns True if switched."""
     switched = page.evaluate(_SWITCH_TO_LIST_VIEW_JS)
     if switched:
         print("  🔀 Switched to list view")
-        time.sleep(3)
     return switched
 
 LIBRARY_PATH = Path(__file__).parent.parent / "data" / "library.json"
@@ -37,16 +54,48 @@ ENRICH_QUESTION = (
     "What is the content of this notebook? What topics are covered? "
     "Provide a complete overview briefly and concisely"
 )
+ENRICH_CONCURRENCY = 4  # Notebook tabs answering at the same time
+
+# Response cleanup and topic extraction patterns, compiled once
+_CITATION_DOTS = re.compile(r'\d{1,3}\.{3,}')
+_CITATION_BRACKET = re.compile(r'\[\d+\]')
+_BARE_NUM = re.compile(r'(?<!\d)\d{1,2}(?!\d)')
+_REMINDER = re.compile(r'EXTREMELY IMPORTANT:.*', re.DOTALL)
+_HEADER = re.compile(r'[•\-\*]\s+\*{0,2}(.+?)\*{0,2}\s*:')
+_SLUG_BAD = re.compile(r'[^a-z0-9\-]')
+_SLUG_DASH = re.compile(r'-+')
+_SLUG_TRANS = str.maketrans({' ': '-'})
+
+
+def load_library():
+    """Load library.json, or return an empty library if it doesn't exist yet."""
+    if not LIBRARY_PATH.exists():
+        return {"notebooks": {}, "active_notebook_id": None, "updated_at": None}
+    data = LIBRARY_PATH.read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def save_library(library):
+    """Write library.json via a temp file + rename so a crash can't corrupt it."""
+    if orjson:
+        data = orjson.dumps(library, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(library, indent=2).encode("utf-8")
+    LIBRARY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = LIBRARY_PATH.with_suffix(".json.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, LIBRARY_PATH)
 
 
 def clean_response(text):
     """Strip citation numbers and the follow-up reminder from NotebookLM responses."""
     # Remove citation markers like [1], [2]..., 12, 34..., etc.
-    text = re.sub(r'\d{1,3}\.{3,}', '', text)
-    text = re.sub(r'\[\d+\]', '', text)
-    text = re.sub(r'(?<!\d)\d{1,2}(?!\d)', '', text)
+    # Separate passes on purpose: each pass sees digits joined by the previous one
+    text = _CITATION_DOTS.sub('', text)
+    text = _CITATION_BRACKET.sub('', text)
+    text = _BARE_NUM.sub('', text)
     # Remove the follow-up reminder block
-    text = re.sub(r'EXTREMELY IMPORTANT:.*', '', text, flags=re.DOTALL)
+    text = _REMINDER.sub('', text)
     return text.strip()
 
 
@@ -73,274 +122,377 @@ def extract_topics(raw_answer):
     topics = []
 
     # Look for bullet-point headers: "• Topic Name:" or "- Topic Name:"
-    header_pattern = re.compile(r'[•\-\*]\s+\*{0,2}(.+?)\*{0,2}\s*:')
-    for match in header_pattern.finditer(cleaned):
+    for match in _HEADER.finditer(cleaned):
         topic = match.group(1).strip().strip('*').strip()
         if 3 < len(topic) < 80:
             # Convert to slug format
             slug = topic.lower().replace(' ', '-').replace('/', '-')
-            slug = re.sub(r'[^a-z0-9\-]', '', slug)
-            slug = re.sub(r'-+', '-', slug).strip('-')
+            slug = _SLUG_BAD.sub('', slug)
+            slug = _SLUG_DASH.sub('-', slug).strip('-')
             if slug and len(slug) > 2:
                 topics.append(slug)
 
     # Deduplicate while preserving order
-    seen = set()
-    unique = []
-    for t in topics:
-        if t not in seen:
-            seen.add(t)
-            unique.append(t)
+    return list(dict.fromkeys(topics))[:15]  # Cap at 15 topics
 
-    return unique[:15]  # Cap at 15 topics
 
+def discover_notebooks(context, known_urls=None):
+    """Visit NotebookLM home page and extract all notebook URLs and titles.
 
-def discover_notebooks(playwright, headless=True):
-    """Visit NotebookLM home page and extract all notebook URLs and titles."""
-    context = BrowserFactory.launch_persistent_context(playwright, headless=headless)
+    known_urls maps notebook titles to URLs already in the library; rows with
+    one of those titles are resolved without clicking through to the notebook.
+    """
+    # Own tab: the context may be the browser daemon's, shared with other scripts
+    page = context.new_page()
     try:
-        page = context.pages[0] if context.pages else context.new_page()
-        page.goto(NOTEBOOKLM_HOME, wait_until="domcontentloaded", timeout=60000)
+        return _discover_in_page(page, known_urls or {})
+    finally:
+        page.close()
 
-        # Switch to list/table view if in grid/card view — script expects project-table UI
-        time.sleep(5)
-        _switch_to_list_view(page)
-
-        # Wait for Angular SPA to hydrate — look for project-table rows
-        row_count = 0
-        for attempt in range(6):
-            time.sleep(5)
-            row_count = page.evaluate("""() => {
-                return document.querySelectorAll('project-table tr td, table tr td').length;
-            }""")
-            if row_count > 0:
-                break
-            print(f"  ⏳ Attempt {attempt + 1}: waiting for table to render...")
-
-        if row_count == 0:
-            return []
-
-        # Extract titles and metadata from table rows
-        row_data = page.evaluate("""() => {
-            const results = [];
-            const rows = document.querySelectorAll('project-table tr, table tr');
-            for (const row of rows) {
-                const cells = row.querySelectorAll('td');
-                if (cells.length === 0) continue;
-                const cellTexts = Array.from(cells).map(td => td.textContent.trim());
-                let title = '';
-                for (const text of cellTexts) {
-                    if (text && text.length > 1 && !text.match(/^(\\d+|\\.\\.\\.)$/)) {
-                        title = text;
-                        break;
-                    }
+
+def _discover_in_page(page, known_urls):
+    from patchright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    page.goto(NOTEBOOKLM_HOME, wait_until="domcontentloaded", timeout=60000)
+
+    # Wait for Angular SPA to hydrate, then switch to list/table view if in
+    # grid/card view — script expects project-table UI
+    try:
+        page.wait_for_function(_HOME_READY_JS, timeout=30000)
+    except PlaywrightTimeoutError:
+        print("  ⚠️  Home page did not finish loading")
+        return []
+    _switch_to_list_view(page)
+
+    # Returns as soon as the first row renders
+    print("  ⏳ Waiting for table to render...")
+    try:
+        page.locator("project-table tr td, table tr td").first.wait_for(timeout=30000)
+    except PlaywrightTimeoutError:
+        return []
+
+    # Extract titles, metadata and URLs from table rows in a single round-trip
+    row_data = page.evaluate("""() => {
+        const results = [];
+        const rows = document.querySelectorAll('project-table tr, table tr');
+        for (const row of rows) {
+            const cells = row.querySelectorAll('td');
+            if (cells.length === 0) continue;
+            const cellTexts = Array.from(cells).map(td => td.textContent.trim());
+            let title = '';
+            for (const text of cellTexts) {
+                if (text && text.length > 1 && !text.match(/^(\\d+|\\.\\.\\.)$/)) {
+                    title = text;
+                    break;
                 }
-                if (title) results.push({ title: title, cellTexts: cellTexts });
             }
-            return results;
-        }""")
+            if (!title) continue;
+
+            // Resolve the notebook URL from the DOM so no navigation is needed:
+            // a link inside the row, a notebook id attribute, or Angular component state
+            let url = '';
+            const link = row.querySelector('a[href*="/notebook/"]');
+            if (link) url = link.href;
+            if (!url) {
+                let id = row.dataset.notebookId || row.dataset.projectId || '';
+                if (!id && window.ng && typeof window.ng.getComponent === 'function') {
+                    const component = window.ng.getComponent(row);
+                    id = (component && (component.notebookId || component.projectId)) || '';
+                }
+                if (id) url = location.origin + '/notebook/' + id;
+            }
+            results.push({
+                title: title,
+                sources: cellTexts[1] || '',
+                date: cellTexts[2] || '',
+                url: url
+            });
+        }
+        return results;
+    }""")
 
-        print(f"  Found {len(row_data)} notebooks in table. Resolving URLs...")
+    print(f"  Found {len(row_data)} notebooks in table. Resolving URLs...")
 
-        # Click each row to navigate, capture URL, then return to home page
-        notebooks = []
-        for i, rd in enumerate(row_data):
-            title = rd["title"]
-            sources = rd["cellTexts"][1] if len(rd["cellTexts"]) > 1 else ""
-            date = rd["cellTexts"][2] if len(rd["cellTexts"]) > 2 else ""
+    # A title shared by several rows can't be mapped to a single known URL
+    title_counts = Counter(rd["title"] for rd in row_data)
 
-            try:
-                # Find the matching row by title text and click it
-                clicked = page.evaluate("""(title) => {
-                    const cells = document.querySelectorAll('project-table tr td:first-child, table tr td:first-child');
-                    for (const cell of cells) {
-                        if (cell.textContent.trim() === title) {
-                            cell.click();
-                            return true;
-                        }
+    # Use URLs read from the table; only click rows that exposed none,
+    # capturing the URL and returning to the home page after each click
+    notebooks = []
+    for i, rd in enumerate(row_data):
+        title, sources, date = rd["title"], rd["sources"], rd["date"]
+
+        if rd["url"]:
+            print(f"  {i+1}/{len(row_data)}. {title}")
+            print(f"           → {rd['url']}")
+            notebooks.append({"title": title, "url": rd["url"], "sources": sources, "date": date})
+            continue
+
+        if title in known_urls and title_counts[title] == 1:
+            print(f"  {i+1}/{len(row_data)}. {title} (already in library)")
+            notebooks.append({"title": title, "url": known_urls[title], "sources": sources, "date": date})
+            continue
+
+        try:
+            # Find the matching row by title text and click it
+            clicked = page.evaluate("""(title) => {
+                const cells = document.querySelectorAll('project-table tr td:first-child, table tr td:first-child');
+                for (const cell of cells) {
+                    if (cell.textContent.trim() === title) {
+                        cell.click();
+                        return true;
                     }
-                    return false;
-                }""", title)
-
-                if clicked:
-                    page.wait_for_url("**/notebook/**", timeout=15000)
-                    url = page.url
-                    print(f"  {i+1}/{len(row_data)}. {title}")
-                    print(f"           → {url}")
-                    notebooks.append({"title": title, "url": url, "sources": sources, "date": date})
-                else:
-                    print(f"  {i+1}/{len(row_data)}. {title} → ⚠️ Row not found")
-                    notebooks.append({"title": title, "url": None, "sources": sources, "date": date})
-            except Exception as e:
-                print(f"  {i+1}/{len(row_data)}. {title} → ❌ {e}")
+                }
+                return false;
+            }""", title)
+
+            if clicked:
+                page.wait_for_url("**/notebook/**", timeout=15000)
+                url = page.url
+                print(f"  {i+1}/{len(row_data)}. {title}")
+                print(f"           → {url}")
+                notebooks.append({"title": title, "url": url, "sources": sources, "date": date})
+            else:
+                print(f"  {i+1}/{len(row_data)}. {title} → ⚠️ Row not found")
                 notebooks.append({"title": title, "url": None, "sources": sources, "date": date})
+        except Exception as e:
+            print(f"  {i+1}/{len(row_data)}. {title} → ❌ {e}")
+            notebooks.append({"title": title, "url": None, "sources": sources, "date": date})
 
-            # Navigate back to home page fresh each time
-            page.goto(NOTEBOOKLM_HOME, wait_until="domcontentloaded", timeout=60000)
-            # Re-switch to list view and wait for table to fully re-render
-            time.sleep(3)
+        # Navigate back to home page fresh each time
+        page.goto(NOTEBOOKLM_HOME, wait_until="domcontentloaded", timeout=60000)
+        # Re-switch to list view and wait for table to fully re-render
+        try:
+            page.wait_for_function(_HOME_READY_JS, timeout=30000)
             _switch_to_list_view(page)
-            for wait_attempt in range(10):
-                time.sleep(3)
-                current_rows = page.evaluate("""() => {
-                    const cells = document.querySelectorAll('project-table tr td:first-child, table tr td:first-child');
-                    return Array.from(cells).map(c => c.textContent.trim()).filter(t => t.length > 0).length;
-                }""")
-                if current_rows >= len(row_data):
-                    break
-
-        return notebooks
-    finally:
-        context.close()
+            page.wait_for_function(_ROWS_RENDERED_JS, arg=len(row_data), timeout=30000)
+        except PlaywrightTimeoutError:
+            pass
 
+    return notebooks
 
-def enrich_notebooks(library, notebook_slugs, show_browser=False):
-    """Query each notebook for content summary and populate description/topics."""
-    from ask_question import ask_notebooklm
 
-    enriched = 0
-    total = len(notebook_slugs)
+def enrich_notebooks(library, notebook_slugs, pool):
+    """Query each notebook for content summary and populate description/topics.
 
-    for i, slug in enumerate(notebook_slugs):
-        nb = library["notebooks"][slug]
-        url = nb["url"]
-        name = nb["name"]
+    Updates library in place and returns the number of notebooks enriched;
+    saving is left to the caller.
 
-        print(f"\n  📖 [{i+1}/{total}] Enriching: {name}")
-        print(f"     URL: {url}")
+    Questions are submitted in batches of ENRICH_CONCURRENCY tabs of a context
+    checked out from the caller's BrowserPool, so NotebookLM generates those
+    answers in parallel.
+    """
+    from ask_question import submit_question, wait_for_answer
+    from auth_manager import AuthManager
 
-        try:
-            raw_answer = ask_notebooklm(
-                question=ENRICH_QUESTION,
-                notebook_url=url,
-                headless=not show_browser
-            )
-
-            if raw_answer:
-                description = extract_description(raw_answer)
-                topics = extract_topics(raw_answer)
-
-                nb["description"] = description
-                if topics:
-                    nb["topics"] = topics
-                nb["updated_at"] = datetime.now().isoformat()
-
-                print(f"     ✅ Description: {description[:100]}...")
-                print(f"     ✅ Topics: {', '.join(topics[:5])}{'...' if len(topics) > 5 else ''}")
-                enriched += 1
-            else:
-                print(f"     ⚠️  No answer received — skipping")
-        except Exception as e:
-            print(f"     ❌ Error: {e}")
+    if not AuthManager().is_authenticated():
+        print("⚠️ Not authenticated. Run: python auth_manager.py setup")
+        return 0
 
-        time.sleep(2)  # Brief pause between notebooks
+    enriched = 0
+    total = len(notebook_slugs)
 
-    # Save library
-    library["updated_at"] = datetime.now().isoformat()
-    with open(LIBRARY_PATH, "w") as f:
-        json.dump(library, f, indent=2)
+    for start in range(0, total, ENRICH_CONCURRENCY):
+        batch = notebook_slugs[start:start + ENRICH_CONCURRENCY]
 
-    print(f"\n💾 Enriched {enriched}/{total} notebooks. Library saved.")
+        with pool.checkout() as context:
+            # Submit every question in the batch before waiting on any answer
+            pending = []
+            try:
+                for i, slug in enumerate(batch, start + 1):
+                    nb = library["notebooks"][slug]
+                    print(f"\n  📖 [{i}/{total}] Enriching: {nb['name']}")
+                    print(f"     URL: {nb['url']}")
+
+                    page = None
+                    try:
+                        page = context.new_page()
+                        if submit_question(page, nb["url"], ENRICH_QUESTION):
+                            pending.append((i, nb, page))
+                            continue
+                        print(f"     ⚠️  Could not submit question — skipping")
+                    except Exception as e:
+                        print(f"     ❌ Error: {e}")
+                    if page:
+                        page.close()
+
+                # Collect answers; later tabs keep generating while earlier ones are read
+                while pending:
+                    i, nb, page = pending.pop(0)
+                    print(f"\n  📖 [{i}/{total}] Reading answer: {nb['name']}")
+                    try:
+                        raw_answer = wait_for_answer(page)
+
+                        if raw_answer:
+                            description = extract_description(raw_answer)
+                            topics = extract_topics(raw_answer)
+
+                            nb["description"] = description
+                            if topics:
+                                nb["topics"] = topics
+                            nb["updated_at"] = datetime.now().isoformat()
+
+                            print(f"     ✅ Description: {description[:100]}...")
+                            print(f"     ✅ Topics: {', '.join(topics[:5])}{'...' if len(topics) > 5 else ''}")
+                            enriched += 1
+                        else:
+                            print(f"     ⚠️  No answer received — skipping")
+                    except Exception as e:
+                        print(f"     ❌ Error: {e}")
+                    finally:
+                        page.close()
+            finally:
+                # Don't leak tabs if the batch is aborted (e.g. Ctrl+C)
+                for _, _, page in pending:
+                    try:
+                        page.close()
+                    except Exception:
+                        pass
+
+    print(f"\n✅ Enriched {enriched}/{total} notebooks.")
     return enriched
 
 
+USAGE = """Usage: discover_notebooks.py [--sync] [--enrich] [--force] [--show-browser]
+
+  --sync          Add newly discovered notebooks to the library
+  --enrich        Fill in empty descriptions/topics by asking each notebook
+  --force         Re-resolve every notebook URL, ignoring the library
+  --show-browser  Show the browser window"""
+
+
 def main():
+    if "-h" in sys.argv or "--help" in sys.argv:
+        print(USAGE)
+        return
+
     show_browser = "--show-browser" in sys.argv
     sync = "--sync" in sys.argv
     enrich_flag = "--enrich" in sys.argv
+    force = "--force" in sys.argv
 
+    # Playwright is only imported once a browser is actually needed
     from patchright.sync_api import sync_playwright
+    from browser_utils import BrowserPool
+
+    # Load existing library and index the fields the hot paths query, so
+    # membership checks don't walk every notebook entry
+    library = load_library()
+    url_index = {nb["url"] for nb in library["notebooks"].values() if nb.get("url")}
+    # Ordered set of slugs with an empty description
+    unenriched_index = dict.fromkeys(
+        slug for slug, nb in library["notebooks"].items()
+        if not nb.get("description") and nb.get("url")
+    )
+
+    # Titles already resolved to URLs, unless --force re-resolves every row
+    known_urls = {}
+    if not force:
+        name_counts = Counter(nb["name"] for nb in library["notebooks"].values())
+        known_urls = {
+            nb["name"]: nb["url"] for nb in library["notebooks"].values()
+            if nb.get("url") and name_counts[nb["name"]] == 1
+        }
 
     print("🔍 Discovering notebooks from NotebookLM home page...\n")
 
     with sync_playwright() as playwright:
-        notebooks = discover_notebooks(playwright, headless=not show_browser)
-
-    if not notebooks:
-        print("❌ No notebooks found. Try with --show-browser to debug.")
-        return
-
-    print(f"Found {len(notebooks)} notebook(s):\n")
-    for i, nb in enumerate(notebooks, 1):
-        print(f"  {i}. {nb['title']}")
-        print(f"     {nb['url']}")
+        # Discovery and enrichment share one pre-warmed Chrome
+        pool = BrowserPool(playwright, headless=not show_browser)
+        try:
+            with pool.checkout() as context:
+                notebooks = discover_notebooks(context, known_urls)
+
+            if not notebooks:
+                print("❌ No notebooks found. Try with --show-browser to debug.")
+                return
+
+            print(f"Found {len(notebooks)} notebook(s):\n")
+            for i, nb in enumerate(notebooks, 1):
+                print(f"  {i}. {nb['title']}")
+                print(f"     {nb['url']}")
+
+            new_notebooks = [nb for nb in notebooks if nb.get("url") and nb["url"] not in url_index]
+            new_slugs = []
+            dirty = False
+
+            if new_notebooks:
+                print(f"\n📋 {len(new_notebooks)} NEW notebook(s) not in library:")
+                for nb in new_notebooks:
+                    print(f"  • {nb['title']} — {nb['url']}")
+
+                if sync:
+                    print("\n⏳ Adding new notebooks to library...")
+                    for nb in new_notebooks:
+                        slug = nb["title"].lower().strip().translate(_SLUG_TRANS)
+                        slug = _SLUG_DASH.sub("-", slug).strip("-")
+
+                        # A same-named notebook is replaced; drop its URL from the index
+                        replaced = library["notebooks"].get(slug)
+                        if replaced:
+                            url_index.discard(replaced.get("url"))
+
+                        library["notebooks"][slug] = {
+                            "id": slug,
+                            "url": nb["url"],
+                            "name": nb["title"],
+                            "description": "",
+                            "topics": [],
+                            "content_types": [],
+                            "use_cases": [],
+                            "tags": [],
+                            "created_at": datetime.now().isoformat(),
+                            "updated_at": datetime.now().isoformat(),
+                            "use_count": 0,
+                            "last_used": None
+                        }
+                        new_slugs.append(slug)
+                        url_index.add(nb["url"])
+                        unenriched_index[slug] = None
+                        print(f"  ✅ Added: {nb['title']}")
 
-    # Load existing library
-    if LIBRARY_PATH.exists():
-        with open(LIBRARY_PATH) as f:
-            library = json.load(f)
-    else:
-        library = {"notebooks": {}, "active_notebook_id": None, "updated_at": None}
-
-    existing_urls = {nb["url"] for nb in library["notebooks"].values()}
-
-    new_notebooks = [nb for nb in notebooks if nb.get("url") and nb["url"] not in existing_urls]
-    new_slugs = []
-
-    if new_notebooks:
-        print(f"\n📋 {len(new_notebooks)} NEW notebook(s) not in library:")
-        for nb in new_notebooks:
-            print(f"  • {nb['title']} — {nb['url']}")
-
-        if sync:
-            print("\n⏳ Adding new notebooks to library...")
-            for nb in new_notebooks:
-                slug = nb["title"].lower().strip()
-                slug = slug.replace(" ", "-").replace("&", "&")
-                while "--" in slug:
-                    slug = slug.replace("--", "-")
-                slug = slug.strip("-")
-
-                library["notebooks"][slug] = {
-                    "id": slug,
-                    "url": nb["url"],
-                    "name": nb["title"],
-                    "description": "",
-                    "topics": [],
-                    "content_types": [],
-                    "use_cases": [],
-                    "tags": [],
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat(),
-                    "use_count": 0,
-                    "last_used": None
-                }
-                new_slugs.append(slug)
-                print(f"  ✅ Added: {nb['title']}")
+                    dirty = True
+                else:
+                    print("\n   Run with --sync to auto-add them to your library.")
+            else:
+                print("\n✅ All discovered notebooks are already in your library.")
 
-            library["updated_at"] = datetime.now().isoformat()
-            with open(LIBRARY_PATH, "w") as f:
-                json.dump(library, f, indent=2)
-            print(f"\n💾 Library saved with {len(library['notebooks'])} total notebooks.")
-        else:
-            print("\n   Run with --sync to auto-add them to your library.")
-    else:
-        print("\n✅ All discovered notebooks are already in your library.")
+            # Find all notebooks that need enrichment (empty description)
+            unenriched = list(unenriched_index)
 
-    # Find all notebooks that need enrichment (empty description)
-    unenriched = [
-        slug for slug, nb in library["notebooks"].items()
-        if not nb.get("description") and nb.get("url")
-    ]
-
-    # Determine whether to enrich
-    should_enrich = False
-    if enrich_flag:
-        should_enrich = True
-    elif unenriched and sync:
-        print(f"\n🔎 {len(unenriched)} notebook(s) have empty descriptions.")
-        response = input("   Enrich them with NotebookLM summaries? (y/n): ").strip().lower()
-        should_enrich = response in ("y", "yes")
-
-    if should_enrich and unenriched:
-        print(f"\n🧠 Enriching {len(unenriched)} notebook(s)...\n")
-        enrich_notebooks(library, unenriched, show_browser=show_browser)
-    elif should_enrich and not unenriched:
-        print("\n✅ All notebooks already have descriptions.")
-
-    # Output JSON for programmatic use
-    print("\n---JSON---")
-    print(json.dumps(notebooks, indent=2))
+            try:
+                # Determine whether to enrich
+                should_enrich = False
+                if enrich_flag:
+                    should_enrich = True
+                elif unenriched and sync:
+                    print(f"\n🔎 {len(unenriched)} notebook(s) have empty descriptions.")
+                    response = input("   Enrich them with NotebookLM summaries? (y/n): ").strip().lower()
+                    should_enrich = response in ("y", "yes")
+
+                if should_enrich and unenriched:
+                    print(f"\n🧠 Enriching {len(unenriched)} notebook(s)...\n")
+                    # Entries are updated in place, so keep whatever was gathered
+                    # even if enrichment stops early
+                    dirty = True
+                    try:
+                        enrich_notebooks(library, unenriched, pool)
+                    except KeyboardInterrupt:
+                        print("\n⚠️ Enrichment interrupted")
+                elif should_enrich and not unenriched:
+                    print("\n✅ All notebooks already have descriptions.")
+            finally:
+                # Single write covering both --sync additions and enrichment
+                if dirty:
+                    library["updated_at"] = datetime.now().isoformat()
+                    save_library(library)
+                    print(f"\n💾 Library saved with {len(library['notebooks'])} total notebooks.")
+
+            # Output JSON for programmatic use
+            print("\n---JSON---")
+            print(json.dumps(notebooks, indent=2))
+        finally:
+            pool.close()
 
 
 if __name__ == "__main__":
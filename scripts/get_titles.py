@@ -2,84 +2,122 @@
 """Visit each notebook URL and extract the actual title from NotebookLM."""
 import json
 import sys
-import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from browser_utils import BrowserFactory
+from discover_notebooks import load_library
 
-LIBRARY_PATH = Path(__file__).parent.parent / "data" / "library.json"
+TITLE_CONCURRENCY = 4  # Notebook tabs loading at the same time
 
-def get_notebook_title(playwright, url, headless=True):
-    """Open a notebook and extract its title from the page/tab title."""
-    context = BrowserFactory.launch_persistent_context(playwright, headless=headless)
+
+def open_notebook(context, url):
+    """Start loading a notebook in a new tab without waiting for it to render."""
+    page = context.new_page()
     try:
-        page = context.pages[0] if context.pages else context.new_page()
-        page.goto(url, wait_until="domcontentloaded", timeout=30000)
-        time.sleep(5)  # Wait for page to fully render
-
-        # Primary method: page title is "Notebook Title - NotebookLM"
-        title = None
-        page_title = page.title()
-        if page_title and " - NotebookLM" in page_title:
-            title = page_title.replace(" - NotebookLM", "").strip()
-        elif page_title and page_title.strip() and page_title.strip() != "NotebookLM":
-            title = page_title.strip()
-
-        # Fallback: look for notebook-specific title elements (avoid chat input)
-        if not title:
-            for sel in ['div[class*="notebook-title"]', 'input[aria-label*="title"]']:
-                try:
-                    el = page.query_selector(sel)
-                    if el:
-                        val = el.get_attribute("value") or el.inner_text()
-                        if val and val.strip() and len(val.strip()) > 2:
-                            title = val.strip()
-                            break
-                except:
-                    continue
-
-        return title
-    finally:
-        context.close()
+        page.goto(url, wait_until="commit", timeout=30000)
+    except Exception:
+        page.close()
+        raise
+    return page
+
+
+def get_notebook_title(page):
+    """Extract the notebook title from an opened notebook page."""
+    from patchright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    page.wait_for_load_state("domcontentloaded", timeout=30000)
+    # Returns as soon as the tab title is set; otherwise use the DOM fallback below
+    try:
+        page.wait_for_function("document.title.includes(' - NotebookLM')", timeout=10000)
+    except PlaywrightTimeoutError:
+        pass
+
+    # Primary method: page title is "Notebook Title - NotebookLM"
+    title = None
+    page_title = page.title()
+    if page_title and " - NotebookLM" in page_title:
+        title = page_title.replace(" - NotebookLM", "").strip()
+    elif page_title and page_title.strip() and page_title.strip() != "NotebookLM":
+        title = page_title.strip()
+
+    # Fallback: look for notebook-specific title elements (avoid chat input)
+    if not title:
+        for sel in ['div[class*="notebook-title"]', 'input[aria-label*="title"]']:
+            try:
+                el = page.query_selector(sel)
+                if el:
+                    val = el.get_attribute("value") or el.inner_text()
+                    if val and val.strip() and len(val.strip()) > 2:
+                        title = val.strip()
+                        break
+            except:
+                continue
+
+    return title
 
 
 def main():
-    with open(LIBRARY_PATH) as f:
-        library = json.load(f)
+    library = load_library()
+    if not library["notebooks"]:
+        print("❌ No notebooks in library. Run discover_notebooks.py --sync first.")
+        return
 
+    # Playwright is only imported once a browser is actually needed
     from patchright.sync_api import sync_playwright
+    from browser_utils import BrowserPool
 
     results = {}
     with sync_playwright() as playwright:
-        for nb_id, nb in library["notebooks"].items():
-            url = nb["url"]
-            current_name = nb["name"]
-            print(f"\n📓 Checking: {current_name}")
-            print(f"   URL: {url}")
-
-            try:
-                actual_title = get_notebook_title(playwright, url)
-                if actual_title:
-                    results[nb_id] = {
-                        "current": current_name,
-                        "actual": actual_title,
-                        "match": current_name == actual_title
-                    }
-                    if current_name != actual_title:
-                        print(f"   ❌ Mismatch!")
-                        print(f"      Current: {current_name}")
-                        print(f"      Actual:  {actual_title}")
-                    else:
-                        print(f"   ✅ Match")
-                else:
-                    print(f"   ⚠️  Could not extract title")
-                    results[nb_id] = {"current": current_name, "actual": None, "match": None}
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
-                results[nb_id] = {"current": current_name, "actual": None, "match": None, "error": str(e)}
-
-            time.sleep(2)  # Brief pause between notebooks
+        # One pre-warmed Chrome for the whole run; notebooks load in batches of tabs
+        pool = BrowserPool(playwright, headless=True)
+        try:
+            notebooks = list(library["notebooks"].items())
+            for start in range(0, len(notebooks), TITLE_CONCURRENCY):
+                batch = notebooks[start:start + TITLE_CONCURRENCY]
+
+                with pool.checkout() as context:
+                    # Start every navigation in the batch so the tabs load concurrently
+                    pages = {}
+                    for nb_id, nb in batch:
+                        try:
+                            pages[nb_id] = open_notebook(context, nb["url"])
+                        except Exception as e:
+                            pages[nb_id] = e
+
+                    for nb_id, nb in batch:
+                        url = nb["url"]
+                        current_name = nb["name"]
+                        print(f"\n📓 Checking: {current_name}")
+                        print(f"   URL: {url}")
+
+                        page = pages[nb_id]
+                        try:
+                            if isinstance(page, Exception):
+                                raise page
+                            actual_title = get_notebook_title(page)
+                            if actual_title:
+                                results[nb_id] = {
+                                    "current": current_name,
+                                    "actual": actual_title,
+                                    "match": current_name == actual_title
+                                }
+                                if current_name != actual_title:
+                                    print(f"   ❌ Mismatch!")
+                                    print(f"      Current: {current_name}")
+                                    print(f"      Actual:  {actual_title}")
+                                else:
+                                    print(f"   ✅ Match")
+                            else:
+                                print(f"   ⚠️  Could not extract title")
+                                results[nb_id] = {"current": current_name, "actual": None, "match": None}
+                        except Exception as e:
+                            print(f"   ❌ Error: {e}")
+                            results[nb_id] = {"current": current_name, "actual": None, "match": None, "error": str(e)}
+                        finally:
+                            if not isinstance(page, Exception):
+                                page.close()
+        finally:
+            pool.close()
 
     # Print summary
     print("\n" + "="*60)